@@ -23,16 +23,18 @@ def initialize_environment():
     already embedded.
 
     """
-    sys.path.append(
-        os.path.join(get_downloaded_usd_root(), "lib", "python"))
+    usd_root = get_downloaded_usd_root()
+    usd_python_path = os.path.join(usd_root, "lib", "python")
+    sys.path.append(usd_python_path)
 
     # Resolver settings
     os.environ["PXR_PLUGINPATH_NAME"] = USD_ADDON_DIR
     os.environ["USD_ASSET_RESOLVER"] = ""
     os.environ["TF_DEBUG"] = "1"
-    os.environ["PYTHONPATH"] = os.path.join(
-        get_downloaded_usd_root(), "lib", "python")
-    os.environ["PATH"] = f"{os.getenv('PATH')}{os.path.pathsep}{os.path.join(get_downloaded_usd_root(), 'bin')}"
+    os.environ["PYTHONPATH"] = usd_python_path
+    os.environ["PATH"] = os.pathsep.join(
+        (os.environ["PATH"], os.path.join(usd_root, "bin"))
+    )
     os.environ["AYONLOGGERLOGLVL"] = "WARN"
     os.environ["AYONLOGGERSFILELOGGING"] = "1"
     os.environ["AYONLOGGERSFILEPOS"] = ".log"
@@ -217,12 +217,13 @@ def is_usd_download_needed(addon_settings=None):
 
 
 def validate_file_checksum(filename: str, checksum: str, hash_function: str):
-    """Generate checksum for file based on hash function (MD5 or SHA256).
+    """Generate checksum for file based on hash function.
 
     Args:
         filename (str): Path to file that will have the checksum generated.
         checksum (str): Checksum to compare with the generated checksum.
-        hash_function (str):  Hash function name - supports MD5 or SHA256
+        hash_function (str):  Hash function name - supports MD5, SHA256
+            or BLAKE2b
 
     Returns:
         bool: True if checksums match, False otherwise.
@@ -239,10 +240,12 @@ def validate_file_checksum(filename: str, checksum: str, hash_function: str):
             readable_hash = hashlib.md5(data).hexdigest()
         elif hash_function == "sha256":
             readable_hash = hashlib.sha256(data).hexdigest()
+        elif hash_function == "blake2b":
+            readable_hash = hashlib.blake2b(data).hexdigest()
         else:
             raise ValueError(
                 f"{hash_function} is an invalid hash function."
-                f"Please Enter MD5 or SHA256")
+                f"Please Enter MD5, SHA256 or BLAKE2b")
 
     return readable_hash == checksum
 
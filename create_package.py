@@ -1,6 +1,6 @@
 """Prepares server package from addon repo to upload to server.
 
-Requires Python 3.9. (Or at least 3.8+).
+Requires Python 3.9+.
 
 This script should be called from cloned addon repo.
 
@@ -13,7 +13,8 @@ ADDON_REPO/package/{addon name}/{addon version}
 You can specify `--output_dir` in arguments to change output directory where
 package will be created. Existing package directory will always be purged if
 already present! This could be used to create package directly in server folder
-if available.
+if available. Use `--incremental` to reuse existing package directory and
+process only files that changed since previous build.
 
 Package contains server side files directly,
 client side code zipped in `private` subfolder.
@@ -21,7 +22,8 @@ client side code zipped in `private` subfolder.
 
 import argparse
 import collections
-import contextlib
+import concurrent.futures
+import functools
 import hashlib
 import json
 import logging
@@ -30,8 +32,10 @@ import platform
 import re
 import shutil
 import sys
+import time
 import urllib.request
 import zipfile
+import zlib
 from pathlib import Path
 from typing import Optional
 import package
@@ -70,34 +74,57 @@ USD_SOURCES = {
         }
     }
 
+
 # Patterns of directories to be skipped for server part of addon
-IGNORE_DIR_PATTERNS = [
-    re.compile(pattern)
-    for pattern in {
-        # Skip directories starting with '.'
-        r"^\.",
-        # Skip any pycache folders
-        "^__pycache__$"
-    }
-]
+IGNORE_DIR_PATTERNS = (
+    # Skip directories starting with '.'
+    r"^\.",
+    # Skip any pycache folders
+    "^__pycache__$"
+)
 
 # Patterns of files to be skipped for server part of addon
-IGNORE_FILE_PATTERNS = [
-    re.compile(pattern)
-    for pattern in {
-        # Skip files starting with '.'
-        # NOTE this could be an issue in some cases
-        r"^\.",
-        # Skip '.pyc' files
-        r"\.pyc$"
-    }
-]
+IGNORE_FILE_PATTERNS = (
+    # Skip files starting with '.'
+    # NOTE this could be an issue in some cases
+    r"^\.",
+    # Skip '.pyc' files
+    r"\.pyc$"
+)
+
+# Default zlib compression level of created zip files. Packages are
+#   consumed right away so fast compression is preferred over size
+DEFAULT_COMPRESS_LEVEL = 1
+
+# Files with already compressed content are stored in zip files as they are
+COMPRESSED_FILE_EXTENSIONS = (
+    ".zip", ".whl", ".png", ".jpg", ".gz", ".xz", ".zst"
+)
+
+# Files bigger than this are not compressed in parallel to avoid holding
+#   their whole content in memory
+PARALLEL_ZIP_MAX_FILE_SIZE = 64 * 1024 * 1024
+
+# Maximum size of files waiting to be written to zip file. Their whole
+#   content is held in memory
+PARALLEL_ZIP_MAX_PENDING_SIZE = 256 * 1024 * 1024
+
+# Manifest of source files stats used by incremental build
+BUILD_MANIFEST_FILENAME = ".build-manifest.json"
+
+# Directories created by 'safe_copy_file' during this run
+_CREATED_DIRS = set()
 
 
 def calculate_file_checksum(
-        filepath, hash_algorithm, chunk_size=10000):
+        filepath, hash_algorithm, chunk_size=8 * 1024 * 1024):
     """Calculate file checksum.
 
+    Any algorithm available in 'hashlib' can be used, e.g. 'sha256'
+    or 'blake2b'. Prefer 'sha256' on hosts where OpenSSL uses SHA-NI
+    (check with 'openssl speed -evp sha256'), 'blake2b' is faster
+    on hosts without it.
+
     Args:
         filepath (str): File path.
         hash_algorithm (str): Hash algorithm.
@@ -107,11 +134,15 @@ def calculate_file_checksum(
         str: Checksum of file.
 
     """
-    func = getattr(hashlib, hash_algorithm)
-    hash_obj = func()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            hash_obj.update(chunk)
+    hash_obj = hashlib.new(hash_algorithm)
+    update = hash_obj.update
+    # Reuse one preallocated buffer instead of allocating bytes per chunk
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    # Read in large chunks without buffering, file is read in bulk anyway
+    with open(filepath, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            update(view[:size])
     return hash_obj.hexdigest()
 
 
@@ -138,6 +169,140 @@ class ZipFileLongPaths(zipfile.ZipFile):
             member, tpath, pwd
         )
 
+    def write_precompressed(self, zinfo, data):
+        """Write already compressed data as new member of the archive.
+
+        Args:
+            zinfo (zipfile.ZipInfo): Member info with filled 'CRC',
+                'file_size' and 'compress_type'.
+            data (bytes): Data compressed with 'zinfo.compress_type'.
+
+        """
+        zinfo.compress_size = len(data)
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+
+        with self._lock:
+            if self._writing:
+                raise ValueError(
+                    "Can't write to ZIP archive while an open writing handle"
+                    " exists."
+                )
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader())
+            self.fp.write(data)
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+            self.start_dir = self.fp.tell()
+
+
+def _zip_info_from_stat(dst_path, stat_result):
+    """Create zip member info from already known file stat.
+
+    Same as 'zipfile.ZipInfo.from_file' without calling 'os.stat' again.
+
+    Args:
+        dst_path (str): Destination path in zip file.
+        stat_result (os.stat_result): Stat of source file.
+
+    Returns:
+        zipfile.ZipInfo: Zip member info.
+
+    """
+    arcname = dst_path.replace(os.sep, "/").lstrip("/")
+    date_time = time.localtime(stat_result.st_mtime)[0:6]
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (stat_result.st_mode & 0xFFFF) << 16
+    zinfo.file_size = stat_result.st_size
+    return zinfo
+
+
+def _compress_zip_member(src_path, zinfo, compresslevel):
+    with open(src_path, "rb") as stream:
+        data = stream.read()
+    zinfo.CRC = zlib.crc32(data)
+    if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+        if compresslevel is None:
+            compresslevel = zlib.Z_DEFAULT_COMPRESSION
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    return zinfo, data
+
+
+def write_files_to_zip(zipf, filepaths, stat_results=None):
+    """Write files to zip file, compressing them in parallel threads.
+
+    Files are compressed in a thread pool ('zlib' releases GIL) and written
+    to the zip file in the order they were passed. Only a limited number
+    and size of files is held in memory at once. Big files and files
+    using compression other than deflate are written directly. Files with
+    already compressed content are stored without compression.
+
+    Args:
+        zipf (ZipFileLongPaths): Zip file opened for writing.
+        filepaths (Iterable[tuple[str, str]]): Source file paths with
+            their destination paths in zip file.
+        stat_results (dict[str, os.stat_result], optional): Already known
+            stats of source files by their path.
+
+    """
+    if stat_results is None:
+        stat_results = {}
+    compresslevel = zipf.compresslevel
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    max_pending = max_workers * 4
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor:
+        pending = collections.deque()
+        pending_size = 0
+
+        def write_next_pending():
+            nonlocal pending_size
+            future, size = pending.popleft()
+            pending_size -= size
+            zipf.write_precompressed(*future.result())
+
+        for src_path, dst_path in filepaths:
+            compress_type = zipf.compression
+            if dst_path.lower().endswith(COMPRESSED_FILE_EXTENSIONS):
+                compress_type = zipfile.ZIP_STORED
+
+            stat_result = stat_results.get(src_path)
+            if stat_result is None:
+                stat_result = os.stat(src_path)
+            if (
+                compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+                or stat_result.st_size > PARALLEL_ZIP_MAX_FILE_SIZE
+            ):
+                # Write pending files first to keep order of files
+                while pending:
+                    write_next_pending()
+                zipf.write(src_path, dst_path, compress_type=compress_type)
+                continue
+
+            zinfo = _zip_info_from_stat(dst_path, stat_result)
+            zinfo.compress_type = compress_type
+            pending.append((
+                executor.submit(
+                    _compress_zip_member, src_path, zinfo, compresslevel
+                ),
+                stat_result.st_size
+            ))
+            pending_size += stat_result.st_size
+            while pending and (
+                len(pending) > max_pending
+                or pending_size > PARALLEL_ZIP_MAX_PENDING_SIZE
+            ):
+                write_next_pending()
+
+        while pending:
+            write_next_pending()
+
 
 def safe_copy_file(src_path, dst_path):
     """Copy file and make sure destination directory exists.
@@ -153,13 +318,61 @@ def safe_copy_file(src_path, dst_path):
         return
 
     dst_dir = os.path.dirname(dst_path)
-    with contextlib.suppress(Exception):
-        os.makedirs(dst_dir)
+    if dst_dir not in _CREATED_DIRS:
+        os.makedirs(dst_dir, exist_ok=True)
+        _CREATED_DIRS.add(dst_dir)
     shutil.copy2(src_path, dst_path)
 
 
-def _value_match_regexes(value, regexes):
-    return any(regex.search(value) for regex in regexes)
+def copy_large_file(src_path, dst_path, chunk_size=8 * 1024 * 1024):
+    """Copy big file content to destination path.
+
+    Uses 'os.copy_file_range' when available (Linux) so the data are
+    copied inside the kernel. Falls back to copying in big chunks.
+
+    Args:
+        src_path (Union[str, Path]): File path that will be copied.
+        dst_path (Union[str, Path]): Path to destination file.
+        chunk_size (int, optional): Chunk size used by fallback copy.
+
+    """
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            if hasattr(os, "copy_file_range"):
+                src_fd = src_stream.fileno()
+                dst_fd = dst_stream.fileno()
+                try:
+                    while os.copy_file_range(src_fd, dst_fd, chunk_size):
+                        pass
+                    return
+                except OSError:
+                    # Not supported by filesystem, start over with fallback
+                    src_stream.seek(0)
+                    dst_stream.seek(0)
+                    dst_stream.truncate()
+            shutil.copyfileobj(src_stream, dst_stream, chunk_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _combine_regexes(patterns):
+    """Combine regex patterns into single compiled alternation pattern.
+
+    Args:
+        patterns (tuple[str, ...]): Regex patterns.
+
+    Returns:
+        re.Pattern: Compiled pattern matching any of the patterns.
+
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _value_match_regex(value, regex):
+    return regex.search(value) is not None
+
+
+def _raise_walk_error(error):
+    raise error
 
 
 def find_files_in_subdir(
@@ -171,13 +384,18 @@ def find_files_in_subdir(
 
     Args:
         src_path (str): Source directory path.
-        ignore_file_patterns (list, optional): List of regex patterns
+        ignore_file_patterns (Iterable[str], optional): Regex patterns
             to ignore files.
-        ignore_dir_patterns (list, optional): List of regex patterns
+        ignore_dir_patterns (Iterable[str], optional): Regex patterns
             to ignore directories.
 
-    Returns:
-        list: List of tuples with file path and relative path.
+    Yields:
+        tuple[str, str]: File path and relative path. Relative path always
+            uses forward slashes.
+
+    Raises:
+        OSError: Source directory or any of its subdirectories
+            can't be listed.
 
     """
     if ignore_file_patterns is None:
@@ -185,100 +403,300 @@ def find_files_in_subdir(
 
     if ignore_dir_patterns is None:
         ignore_dir_patterns = IGNORE_DIR_PATTERNS
-    output = []
-
-    hierarchy_queue = collections.deque()
-    hierarchy_queue.append((src_path, []))
-    while hierarchy_queue:
-        item = hierarchy_queue.popleft()
-        dirpath, parents = item
-        for name in os.listdir(dirpath):
-            path = os.path.join(dirpath, name)
-            if os.path.isfile(path):
-                if not _value_match_regexes(name, ignore_file_patterns):
-                    items = list(parents)
-                    items.append(name)
-                    output.append((path, os.path.sep.join(items)))
-                continue
 
-            if not _value_match_regexes(name, ignore_dir_patterns):
-                items = list(parents)
-                items.append(name)
-                hierarchy_queue.append((path, items))
+    ignore_file_regex = _combine_regexes(tuple(ignore_file_patterns))
+    ignore_dir_regex = _combine_regexes(tuple(ignore_dir_patterns))
+    for dirpath, dirnames, filenames in os.walk(
+        src_path, onerror=_raise_walk_error
+    ):
+        # Prune ignored directories so they are not walked at all
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if not _value_match_regex(dirname, ignore_dir_regex)
+        ]
+        rel_dirpath = os.path.relpath(dirpath, src_path)
+        rel_prefix = ""
+        if rel_dirpath != ".":
+            rel_prefix = rel_dirpath.replace(os.sep, "/") + "/"
+
+        for filename in filenames:
+            if not _value_match_regex(filename, ignore_file_regex):
+                yield os.path.join(dirpath, filename), rel_prefix + filename
+
+
+def _get_file_stat_info(filepath, stat_result=None):
+    if stat_result is None:
+        stat_result = os.stat(filepath)
+    return [stat_result.st_size, stat_result.st_mtime_ns]
 
-    return output
+
+def load_build_manifest(addon_output_dir):
+    """Load manifest of previous build from addon output directory.
+
+    Args:
+        addon_output_dir (str): Directory path to addon output directory.
+
+    Returns:
+        dict[str, Any]: Manifest data, empty if manifest does not exist.
+
+    """
+    manifest_path = os.path.join(addon_output_dir, BUILD_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r") as stream:
+        return json.load(stream)
+
+
+def remove_build_manifest(addon_output_dir):
+    """Remove build manifest from addon output directory.
+
+    Args:
+        addon_output_dir (str): Directory path to addon output directory.
+
+    """
+    manifest_path = os.path.join(addon_output_dir, BUILD_MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+
+def store_build_manifest(addon_output_dir, manifest):
+    """Store build manifest to addon output directory.
+
+    Args:
+        addon_output_dir (str): Directory path to addon output directory.
+        manifest (dict[str, Any]): Manifest data.
+
+    """
+    manifest_path = os.path.join(addon_output_dir, BUILD_MANIFEST_FILENAME)
+    with open(manifest_path, "w") as stream:
+        json.dump(manifest, stream)
 
 
-def copy_server_content(addon_output_dir, current_dir, log):
+def copy_server_content(
+    addon_output_dir, current_dir, log, previous_manifest=None
+):
     """Copy server side folders to 'addon_package_dir'.
 
+    Manifest of server files is created only for incremental build, when
+    previous manifest is passed. Files with same size and modification
+    time as in previous manifest are not copied again.
+
     Args:
         addon_output_dir (str): package dir in addon repo dir
         current_dir (str): addon repo dir
         log (logging.Logger)
+        previous_manifest (dict[str, list[int]], optional): Server files
+            manifest of previous build.
+
+    Returns:
+        Union[dict[str, list[int]], None]: Size and modification time
+            of server files by their relative path. None if previous
+            manifest was not passed.
 
     """
     log.info("Copying server content")
 
-    filepaths_to_copy = []
     server_dirpath = os.path.join(current_dir, "server")
+    dst_server_dirpath = os.path.join(addon_output_dir, "server")
 
-    for item in find_files_in_subdir(server_dirpath):
-        src_path, dst_subpath = item
-        dst_path = os.path.join(addon_output_dir, "server", dst_subpath)
-        filepaths_to_copy.append((src_path, dst_path))
+    manifest = None
+    filepaths_to_copy = []
+    if previous_manifest is None:
+        for src_path, dst_subpath in find_files_in_subdir(server_dirpath):
+            filepaths_to_copy.append(
+                (src_path, os.path.join(dst_server_dirpath, dst_subpath))
+            )
+
+    else:
+        manifest = {}
+        for src_path, dst_subpath in find_files_in_subdir(server_dirpath):
+            stat_info = _get_file_stat_info(src_path)
+            manifest[dst_subpath] = stat_info
+            dst_path = os.path.join(dst_server_dirpath, dst_subpath)
+            if (
+                previous_manifest.get(dst_subpath) == stat_info
+                and os.path.exists(dst_path)
+            ):
+                continue
+            filepaths_to_copy.append((src_path, dst_path))
+
+        # Remove files that are not in source anymore
+        for dst_subpath in set(previous_manifest) - set(manifest):
+            dst_path = os.path.join(dst_server_dirpath, dst_subpath)
+            if os.path.exists(dst_path):
+                os.remove(dst_path)
 
-    # Copy files
-    for src_path, dst_path in filepaths_to_copy:
-        safe_copy_file(src_path, dst_path)
+    # Copy files in parallel threads, copy is bound by I/O. Destination
+    #   directories are created only once by 'safe_copy_file'.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=(os.cpu_count() or 1) * 2
+    ) as executor:
+        futures = [
+            executor.submit(safe_copy_file, src_path, dst_path)
+            for src_path, dst_path in filepaths_to_copy
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+    return manifest
 
 
 def _fill_client_version(current_dir):
     version_file = os.path.join(
         current_dir, "client", ADDON_CLIENT_DIR, "version.py"
     )
+    content = CLIENT_VERSION_CONTENT.format(ADDON_NAME, ADDON_VERSION)
+    # Keep modification time of the file if content did not change
+    if os.path.exists(version_file):
+        with open(version_file, "r") as stream:
+            if stream.read() == content:
+                return
+
     with open(version_file, "w") as stream:
-        stream.write(
-            CLIENT_VERSION_CONTENT.format(
-                ADDON_NAME, ADDON_VERSION))
+        stream.write(content)
 
 
-def zip_client_side(addon_package_dir, current_dir, log):
+def zip_client_side(
+    addon_package_dir,
+    current_dir,
+    log,
+    compress_level=DEFAULT_COMPRESS_LEVEL,
+    previous_manifest=None
+):
     """Copy and zip `client` content into 'addon_package_dir'.
 
+    Manifest of client files is created only for incremental build, when
+    previous manifest is passed. Zip file is not created again if client
+    files did not change since previous build.
+
     Args:
         addon_package_dir (str): Output package directory path.
         current_dir (str): Directory path of addon source.
         log (logging.Logger): Logger object.
+        compress_level (int, optional): Zlib compression level.
+        previous_manifest (dict[str, list[int]], optional): Client files
+            manifest of previous build.
+
+    Returns:
+        Union[dict[str, list[int]], None]: Size and modification time
+            of client files by their relative path. None if previous
+            manifest was not passed.
 
     """
     client_dir = os.path.join(current_dir, "client")
     if not os.path.isdir(client_dir):
         log.info("Client directory was not found. Skipping")
-        return
+        return None if previous_manifest is None else {}
 
-    log.info("Preparing client code zip")
     private_dir = os.path.join(addon_package_dir, "private")
 
     if not os.path.exists(private_dir):
         os.makedirs(private_dir)
 
-    zip_filepath = os.path.join(os.path.join(private_dir, "client.zip"))
-    with ZipFileLongPaths(zip_filepath, "w", zipfile.ZIP_DEFLATED) as zipf:
+    zip_filepath = os.path.join(private_dir, "client.zip")
+    manifest = None
+    stat_results = None
+    filepaths = find_files_in_subdir(client_dir)
+    if previous_manifest is not None:
+        filepaths = list(filepaths)
+        stat_results = {path: os.stat(path) for path, _ in filepaths}
+        manifest = {
+            sub_path: _get_file_stat_info(path, stat_results[path])
+            for path, sub_path in filepaths
+        }
+        if manifest == previous_manifest and os.path.exists(zip_filepath):
+            log.info("Client code did not change. Skipping client code zip")
+            return manifest
+
+    log.info("Preparing client code zip")
+    with ZipFileLongPaths(
+        zip_filepath, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level
+    ) as zipf:
         # Add client code content to zip
-        for path, sub_path in find_files_in_subdir(client_dir):
-            zipf.write(path, sub_path)
+        write_files_to_zip(zipf, filepaths, stat_results)
+    return manifest
+
+
+def download_file_with_checksum(
+        src_url, dst_path, hash_algorithm, chunk_size=1024 * 1024):
+    """Download file and calculate its checksum while receiving data.
+
+    Avoids reading the downloaded file again to validate it.
+
+    Args:
+        src_url (str): Url of file to download.
+        dst_path (Union[str, Path]): Path where file will be stored.
+        hash_algorithm (str): Hash algorithm.
+        chunk_size (int, optional): Chunk size for reading response.
+
+    Returns:
+        str: Checksum of downloaded file.
+
+    """
+    hash_obj = hashlib.new(hash_algorithm)
+    update = hash_obj.update
+    with urllib.request.urlopen(src_url) as response:
+        with open(dst_path, "wb") as stream:
+            while chunk := response.read(chunk_size):
+                stream.write(chunk)
+                update(chunk)
+    return hash_obj.hexdigest()
+
+
+def _download_usd_zip(
+    src_url: str,
+    zip_path: Path,
+    checksum: str,
+    checksum_algorithm: str,
+    log: logging.Logger
+):
+    """Download single USD zip file if not downloaded yet.
+
+    Args:
+        src_url (str): Url of USD zip file.
+        zip_path (Path): Path where zip file is stored.
+        checksum (str): Expected checksum of zip file.
+        checksum_algorithm (str): Algorithm of the checksum.
+        log (logging.Logger): Logger object.
+
+    Raises:
+        ValueError: Checksum of downloaded file does not match.
+
+    """
+    if zip_path.exists():
+        file_checksum = calculate_file_checksum(
+            zip_path, checksum_algorithm)
+        if checksum == file_checksum:
+            log.debug(f"USD zip from {src_url} already exists")
+            return
+        os.remove(zip_path)
+
+    log.debug(f"USD zip from {src_url} -> {zip_path}")
+    log.info(f"USD zip download - started ({zip_path.name})")
+
+    file_checksum = download_file_with_checksum(
+        src_url, zip_path, checksum_algorithm)
+    log.info(f"USD zip download - finished ({zip_path.name})")
+
+    if checksum != file_checksum:
+        raise ValueError(
+            f"USD zip checksum mismatch: {file_checksum} != {checksum}"
+        )
 
 
 def download_usd_zip(downloads_dir: Path, log: logging.Logger):
     """Download USD zip files.
 
+    Zip files are downloaded in parallel threads.
+
     Args:
         downloads_dir (Path): Directory path to download zip files.
         log (logging.Logger): Logger object.
 
     """
     zip_files_info = []
+    download_args = []
     for item_name, item_info in USD_SOURCES.items():
         for platform_name, platform_info in item_info.items():
             src_url = platform_info["url"]
@@ -293,29 +711,23 @@ def download_usd_zip(downloads_dir: Path, log: logging.Logger):
                 "checksum_algorithm": checksum_algorithm,
                 "platform": platform_name,
             })
-            if zip_path.exists():
-                file_checksum = calculate_file_checksum(
-                    zip_path, checksum_algorithm)
-                if checksum == file_checksum:
-                    log.debug(f"USD zip from {src_url} already exists")
-                    continue
-                os.remove(zip_path)
-
-            log.debug(f"USD zip from {src_url} -> {zip_path}")
-            log.info("USD zip download - started")
-
-            urllib.request.urlretrieve(
-                src_url,
-                zip_path)
-            log.info("USD zip download - finished")
-
-            file_checksum = calculate_file_checksum(
-                zip_path, checksum_algorithm)
-
-            if checksum != file_checksum:
-                raise ValueError(
-                    f"USD zip checksum mismatch: {file_checksum} != {checksum}"
-                )
+            download_args.append(
+                (src_url, zip_path, checksum, checksum_algorithm)
+            )
+
+    if not download_args:
+        return zip_files_info
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(download_args)
+    ) as executor:
+        futures = [
+            executor.submit(_download_usd_zip, *args, log)
+            for args in download_args
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            # Raise exception (e.g. checksum mismatch) as soon as possible
+            future.result()
 
     return zip_files_info
 
@@ -325,7 +737,8 @@ def create_server_package(
     output_dir: str,
     addon_output_dir: str,
     addon_version: str,
-    log: logging.Logger
+    log: logging.Logger,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
 ):
     """Create server package zip file.
 
@@ -337,33 +750,39 @@ def create_server_package(
         addon_output_dir (str): Directory path to addon output directory.
         addon_version (str): Version of addon.
         log (logging.Logger): Logger object.
+        compress_level (int, optional): Zlib compression level.
 
     """
     log.info("Creating server package")
     output_path = os.path.join(
         output_dir, f"{ADDON_NAME}-{addon_version}.zip"
     )
-    with ZipFileLongPaths(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+    with ZipFileLongPaths(
+        output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level
+    ) as zipf:
         # Write a manifest to zip
-        zipf.write(
-            os.path.join(current_dir, "package.py"), "package.py"
-        )
+        filepaths = [
+            (os.path.join(current_dir, "package.py"), "package.py")
+        ]
 
         # Move addon content to zip into 'addon' directory
-        addon_output_dir_offset = len(addon_output_dir) + 1
+        addon_output_dir_prefix = addon_output_dir + os.sep
         for root, _, filenames in os.walk(addon_output_dir):
             if not filenames:
                 continue
 
-            dst_root = None
+            dst_prefix = ""
             if root != addon_output_dir:
-                dst_root = root[addon_output_dir_offset:]
+                dst_root = root.removeprefix(addon_output_dir_prefix)
+                dst_prefix = dst_root.replace(os.sep, "/") + "/"
             for filename in filenames:
-                src_path = os.path.join(root, filename)
-                dst_path = filename
-                if dst_root:
-                    dst_path = os.path.join(dst_root, filename)
-                zipf.write(src_path, dst_path)
+                if not dst_prefix and filename == BUILD_MANIFEST_FILENAME:
+                    continue
+                filepaths.append(
+                    (os.path.join(root, filename), dst_prefix + filename)
+                )
+
+        write_files_to_zip(zipf, filepaths)
 
     log.info(f"Output package can be found: {output_path}")
 
@@ -371,16 +790,25 @@ def create_server_package(
 def main(
     output_dir: Optional[str] = None,
     skip_zip: bool = False,
-    keep_sources: bool = False
+    keep_sources: bool = False,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    incremental: bool = False
 ):
     """Create addon package.
 
     Main function to execute package creation.
 
+    Incremental build does not purge existing package directory. Files
+    that did not change since previous build, based on their size and
+    modification time, are not copied and zipped again. Sources are
+    always kept so they can be reused by next build.
+
     Args:
         output_dir (str, optional): Output directory path.
         skip_zip (bool): Skip zipping server package.
         keep_sources (bool): Keep sources when server package is created.
+        compress_level (int): Zlib compression level of zip files.
+        incremental (bool): Reuse output of previous build.
 
     """
     logging.basicConfig(level=logging.INFO)
@@ -388,12 +816,14 @@ def main(
     log.setLevel(logging.INFO)
 
     log.info("Start creating package")
+    # Directories created by previous call may have been removed since
+    _CREATED_DIRS.clear()
 
     current_dir = os.path.dirname(os.path.abspath(__file__))
     if not output_dir:
         output_dir = os.path.join(current_dir, "package")
 
-    downloads_dir = Path(os.path.join(current_dir, "downloads"))
+    downloads_dir = Path(current_dir) / "downloads"
     downloads_dir.mkdir(exist_ok=True)
 
     files_info = download_usd_zip(downloads_dir, log)
@@ -401,7 +831,14 @@ def main(
     new_created_version_dir = os.path.join(
         output_dir, ADDON_NAME, ADDON_VERSION
     )
-    if os.path.isdir(new_created_version_dir):
+    previous_manifest = {}
+    if incremental:
+        keep_sources = True
+        previous_manifest = load_build_manifest(new_created_version_dir)
+        # Manifest is stored again only when build finishes, so outputs
+        #   of an interrupted build are not reused by next build
+        remove_build_manifest(new_created_version_dir)
+    elif os.path.isdir(new_created_version_dir):
         log.info(f"Purging {new_created_version_dir}")
         shutil.rmtree(output_dir)
 
@@ -414,33 +851,111 @@ def main(
     if not os.path.exists(addon_output_dir):
         os.makedirs(addon_output_dir)
 
-    copy_server_content(addon_output_dir, current_dir, log)
+    previous_server_manifest = None
+    previous_client_manifest = None
+    if incremental:
+        previous_server_manifest = previous_manifest.get("server", {})
+        previous_client_manifest = {}
+        # Client zip must be created again when compression level changed
+        if previous_manifest.get("compress_level") == compress_level:
+            previous_client_manifest = previous_manifest.get("client", {})
+
+    server_manifest = copy_server_content(
+        addon_output_dir,
+        current_dir,
+        log,
+        previous_server_manifest
+    )
 
     private_dir = Path(addon_output_dir) / "private"
     if not private_dir.exists():
         private_dir.mkdir(parents=True)
 
+    # Remove zip files that are not in sources anymore
+    filenames = {file_info["filename"] for file_info in files_info}
+    for file_info in previous_manifest.get("files_info", []):
+        filename = file_info["filename"]
+        dst_path = private_dir / filename
+        if filename not in filenames and dst_path.exists():
+            os.remove(dst_path)
+
     for file_info in files_info:
         filename = file_info["filename"]
         src_path = downloads_dir / filename
         dst_path = private_dir / filename
-        shutil.copy(src_path, dst_path)
+        if dst_path.exists():
+            if (
+                previous_manifest.get("files_info") == files_info
+                or os.path.samefile(src_path, dst_path)
+            ):
+                continue
+            os.remove(dst_path)
+        # Hard link avoids copying the zip, copy if linking is not possible
+        #   (e.g. output is on a different filesystem)
+        try:
+            os.link(src_path, dst_path)
+        except OSError:
+            copy_large_file(src_path, dst_path)
 
     zips_info_path = private_dir / "files_info.json"
     with open(zips_info_path, "w") as stream:
         json.dump(files_info, stream)
 
-    zip_client_side(addon_output_dir, current_dir, log)
+    client_manifest = zip_client_side(
+        addon_output_dir,
+        current_dir,
+        log,
+        compress_level,
+        previous_client_manifest
+    )
+
+    manifest = None
+    if incremental:
+        manifest = {
+            "compress_level": compress_level,
+            "package": _get_file_stat_info(
+                os.path.join(current_dir, "package.py")
+            ),
+            "files_info": files_info,
+            "server": server_manifest,
+            "client": client_manifest,
+        }
 
     # Skip server zipping
     if not skip_zip:
-        create_server_package(
-            current_dir, output_dir, addon_output_dir, ADDON_VERSION, log
+        output_path = os.path.join(
+            output_dir, f"{ADDON_NAME}-{ADDON_VERSION}.zip"
         )
+        # Server package is reused only if it is the one created by
+        #   previous build (e.g. previous build did not skip zipping)
+        previous_package_zip = previous_manifest.pop("package_zip", None)
+        if (
+            incremental
+            and manifest == previous_manifest
+            and os.path.exists(output_path)
+            and _get_file_stat_info(output_path) == previous_package_zip
+        ):
+            log.info(
+                "Package content did not change. Skipping server package"
+            )
+        else:
+            create_server_package(
+                current_dir,
+                output_dir,
+                addon_output_dir,
+                ADDON_VERSION,
+                log,
+                compress_level
+            )
+        if incremental:
+            manifest["package_zip"] = _get_file_stat_info(output_path)
         # Remove sources only if zip file is created
         if not keep_sources:
             log.info("Removing source files for server package")
             shutil.rmtree(addon_output_root)
+
+    if incremental:
+        store_build_manifest(addon_output_dir, manifest)
     log.info("Package creation finished")
 
 
@@ -463,6 +978,27 @@ if __name__ == "__main__":
             "Keep folder structure when server package is created."
         )
     )
+    parser.add_argument(
+        "--compress-level",
+        dest="compress_level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar="{0-9}",
+        help=(
+            "Zlib compression level of created zip files"
+            f" (default: {DEFAULT_COMPRESS_LEVEL})."
+        )
+    )
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        help=(
+            "Reuse package folder structure of previous build and skip"
+            " files that did not change. Implies '--keep-sources'."
+        )
+    )
     parser.add_argument(
         "-o", "--output",
         dest="output_dir",
@@ -474,4 +1010,10 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args(sys.argv[1:])
-    main(args.output_dir, args.skip_zip, args.keep_sources)
+    main(
+        args.output_dir,
+        args.skip_zip,
+        args.keep_sources,
+        args.compress_level,
+        args.incremental
+    )
@@ -15,6 +15,16 @@ def test_validate_file_checksum(file_info, tmp_path):
     assert utils.validate_file_checksum(str(file_path), file_info['checksum'], file_info['checksum_algorithm'])
 
 
+def test_validate_file_checksum_blake2b(file_info, tmp_path):
+    # Create a temporary file
+    file_path = tmp_path / file_info['filename']
+    file_path.write_text("Hello, World!")
+
+    checksum = hashlib.blake2b(file_path.read_bytes()).hexdigest()
+
+    assert utils.validate_file_checksum(str(file_path), checksum, "blake2b")
+
+
 def test_extract_zip_file(file_info, tmp_path):
     # Create a temporary zip file
     zip_path = tmp_path / file_info['filename']
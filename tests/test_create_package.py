@@ -0,0 +1,224 @@
+# test_create_package.py
+import hashlib
+import os
+import zipfile
+
+import pytest
+
+import create_package
+
+
+@pytest.mark.parametrize("max_pending_size", [256 * 1024 * 1024, 600])
+def test_write_files_to_zip(tmp_path, monkeypatch, max_pending_size):
+    # Make the last file big enough to be written directly
+    monkeypatch.setattr(create_package, "PARALLEL_ZIP_MAX_FILE_SIZE", 1000)
+    monkeypatch.setattr(
+        create_package, "PARALLEL_ZIP_MAX_PENDING_SIZE", max_pending_size
+    )
+    contents = {
+        "text.txt": b"Hello, World!" * 50,
+        "sub/archive.zip": os.urandom(500),
+        "sub/deeper/empty.py": b"",
+        "big.bin": b"0123456789" * 200,
+    }
+    filepaths = []
+    for sub_path, data in contents.items():
+        src_path = tmp_path / "src" / sub_path
+        src_path.parent.mkdir(parents=True, exist_ok=True)
+        src_path.write_bytes(data)
+        os.chmod(src_path, 0o640)
+        filepaths.append((str(src_path), sub_path))
+
+    zip_path = tmp_path / "test.zip"
+    with create_package.ZipFileLongPaths(
+        zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as zipf:
+        create_package.write_files_to_zip(zipf, filepaths)
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.namelist() == list(contents)
+        for sub_path, data in contents.items():
+            zinfo = zipf.getinfo(sub_path)
+            assert zipf.read(sub_path) == data
+            assert zinfo.file_size == len(data)
+            assert (zinfo.external_attr >> 16) & 0o777 == 0o640
+
+        assert zipf.getinfo("text.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert (
+            zipf.getinfo("sub/archive.zip").compress_type
+            == zipfile.ZIP_STORED
+        )
+
+
+def test_find_files_in_subdir(tmp_path):
+    for sub_path in (
+        "root.py",
+        "root.pyc",
+        ".hidden",
+        "sub/module.py",
+        "sub/deeper/data.json",
+        "sub/__pycache__/module.cpython-39.pyc",
+        ".git/config",
+    ):
+        path = tmp_path / sub_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    found = {
+        sub_path: path
+        for path, sub_path in create_package.find_files_in_subdir(
+            str(tmp_path)
+        )
+    }
+
+    assert set(found) == {"root.py", "sub/module.py", "sub/deeper/data.json"}
+    for sub_path, path in found.items():
+        assert os.path.samefile(path, tmp_path / sub_path)
+
+
+def test_find_files_in_subdir_missing_dir(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(create_package.find_files_in_subdir(str(tmp_path / "missing")))
+
+
+@pytest.fixture
+def addon_repo(tmp_path, monkeypatch):
+    """Create minimal addon repository used by 'create_package.main'."""
+    repo_dir = tmp_path / "repo"
+    for sub_path, content in (
+        ("package.py", "name = 'ayon_usd'\n"),
+        ("server/__init__.py", "# server\n"),
+        ("server/settings/main.py", "# settings\n"),
+        (
+            f"client/{create_package.ADDON_CLIENT_DIR}/__init__.py",
+            "# client\n"
+        ),
+    ):
+        path = repo_dir / sub_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    usd_sources = {}
+    for platform_name in ("windows", "linux"):
+        zip_path = tmp_path / f"usd_{platform_name}.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("bin/usd", platform_name)
+        usd_sources[platform_name] = {
+            "url": zip_path.as_uri(),
+            "checksum": hashlib.sha256(zip_path.read_bytes()).hexdigest(),
+            "checksum_algorithm": "sha256",
+        }
+
+    monkeypatch.setattr(
+        create_package, "__file__", str(repo_dir / "create_package.py")
+    )
+    monkeypatch.setattr(create_package, "USD_SOURCES", {"test": usd_sources})
+    return repo_dir
+
+
+def _build(output_dir, caplog, **kwargs):
+    caplog.clear()
+    create_package.main(str(output_dir), incremental=True, **kwargs)
+    return caplog.text
+
+
+def _package_zip_path(output_dir):
+    return output_dir / (
+        f"{create_package.ADDON_NAME}-{create_package.ADDON_VERSION}.zip"
+    )
+
+
+def _touch(path, content):
+    path.write_text(content)
+    # Make sure modification time changes on filesystems with coarse mtime
+    stat_result = path.stat()
+    os.utime(
+        path,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10 ** 9)
+    )
+
+
+def test_incremental_unchanged_rerun(addon_repo, tmp_path, caplog):
+    output_dir = tmp_path / "output"
+    log_text = _build(output_dir, caplog)
+    assert "Preparing client code zip" in log_text
+    assert "Creating server package" in log_text
+
+    log_text = _build(output_dir, caplog)
+    assert "Skipping client code zip" in log_text
+    assert "Skipping server package" in log_text
+
+
+@pytest.mark.parametrize("sub_path, rebuilds_client", [
+    ("server/__init__.py", False),
+    (f"client/{create_package.ADDON_CLIENT_DIR}/__init__.py", True),
+])
+def test_incremental_changed_file(
+    addon_repo, tmp_path, caplog, sub_path, rebuilds_client
+):
+    output_dir = tmp_path / "output"
+    _build(output_dir, caplog)
+    _touch(addon_repo / sub_path, "# changed content\n")
+
+    log_text = _build(output_dir, caplog)
+    assert "Creating server package" in log_text
+    assert ("Preparing client code zip" in log_text) == rebuilds_client
+
+    with zipfile.ZipFile(_package_zip_path(output_dir)) as zipf:
+        if rebuilds_client:
+            with zipf.open("private/client.zip") as stream:
+                with zipfile.ZipFile(stream) as client_zipf:
+                    content = client_zipf.read(sub_path.split("/", 1)[1])
+        else:
+            content = zipf.read(sub_path)
+    assert content == b"# changed content\n"
+
+
+def test_incremental_removed_file(addon_repo, tmp_path, caplog, monkeypatch):
+    output_dir = tmp_path / "output"
+    _build(output_dir, caplog)
+
+    os.remove(addon_repo / "server" / "settings" / "main.py")
+    usd_sources = dict(create_package.USD_SOURCES["test"])
+    usd_sources.pop("linux")
+    monkeypatch.setattr(create_package, "USD_SOURCES", {"test": usd_sources})
+
+    log_text = _build(output_dir, caplog)
+    assert "Creating server package" in log_text
+
+    addon_output_dir = (
+        output_dir
+        / create_package.ADDON_NAME
+        / create_package.ADDON_VERSION
+    )
+    assert not (addon_output_dir / "server" / "settings" / "main.py").exists()
+    assert not (addon_output_dir / "private" / "usd_linux.zip").exists()
+    with zipfile.ZipFile(_package_zip_path(output_dir)) as zipf:
+        names = zipf.namelist()
+    assert "server/settings/main.py" not in names
+    assert "private/usd_linux.zip" not in names
+    assert "private/usd_windows.zip" in names
+
+
+def test_incremental_compress_level_change(addon_repo, tmp_path, caplog):
+    output_dir = tmp_path / "output"
+    _build(output_dir, caplog, compress_level=1)
+
+    log_text = _build(output_dir, caplog, compress_level=9)
+    assert "Preparing client code zip" in log_text
+    assert "Creating server package" in log_text
+
+
+def test_incremental_after_skip_zip(addon_repo, tmp_path, caplog):
+    output_dir = tmp_path / "output"
+    _build(output_dir, caplog)
+    _touch(addon_repo / "server" / "__init__.py", "# changed content\n")
+
+    log_text = _build(output_dir, caplog, skip_zip=True)
+    assert "Creating server package" not in log_text
+
+    log_text = _build(output_dir, caplog)
+    assert "Creating server package" in log_text
+    with zipfile.ZipFile(_package_zip_path(output_dir)) as zipf:
+        assert zipf.read("server/__init__.py") == b"# changed content\n"